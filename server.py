@@ -1,44 +1,116 @@
 #!/usr/bin/env python3
 """Fivetran MCP Server - Read-only access to Fivetran connections, destinations, and groups."""
 
-import json
+import asyncio
 import os
+import random
+import re
 import base64
+import time
+from functools import lru_cache
 from importlib.metadata import PackageNotFoundError, version
 from pathlib import Path
-from typing import Any
+from types import MappingProxyType
+from typing import Any, NamedTuple
 
 import httpx
+import jsonschema
+import orjson
 
 try:
     __version__ = version("fivetran-mcp")
 except PackageNotFoundError:
     __version__ = "unknown"
-from dotenv import load_dotenv
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import Tool, TextContent
 
-load_dotenv()
+# Credentials normally arrive in the environment from .mcp.json. .env is only a
+# fallback, so skip importing dotenv and searching for the file when both are set.
+if not (os.getenv("FIVETRAN_API_KEY") and os.getenv("FIVETRAN_API_SECRET")):
+    from dotenv import load_dotenv
+    load_dotenv()
 
 # Credentials are configured in .mcp.json
 FIVETRAN_API_KEY = os.getenv("FIVETRAN_API_KEY")
 FIVETRAN_API_SECRET = os.getenv("FIVETRAN_API_SECRET")
 FIVETRAN_ALLOW_WRITES = os.getenv("FIVETRAN_ALLOW_WRITES", "false").lower() == "true"
+FIVETRAN_MAX_INFLIGHT = int(os.getenv("FIVETRAN_MAX_INFLIGHT", "16"))
+FIVETRAN_CACHE_TTL = float(os.getenv("FIVETRAN_CACHE_TTL", "0"))
+FIVETRAN_METADATA_TTL = float(os.getenv("FIVETRAN_METADATA_TTL", "3600"))
 BASE_URL = "https://api.fivetran.com"
 SERVER_DIR = Path(__file__).parent
 
+# Shared HTTP client, created on first use so it binds to the running event loop.
+# Reusing it keeps TCP/TLS connections alive across tool calls instead of paying
+# a fresh handshake per request.
+_CLIENT: httpx.AsyncClient | None = None
+
+# Caps concurrent Fivetran API requests when the client fires tool calls in parallel,
+# so a burst queues here instead of tripping rate limits.
+# A limit of 0 would block every call forever, so reject it up front.
+if FIVETRAN_MAX_INFLIGHT < 1:
+    raise ValueError(
+        f"FIVETRAN_MAX_INFLIGHT must be at least 1 (got {FIVETRAN_MAX_INFLIGHT}). "
+        "Configure it in your .mcp.json or .env file."
+    )
+_INFLIGHT = asyncio.Semaphore(FIVETRAN_MAX_INFLIGHT)
+
+# Short-lived cache of GET responses, keyed by (endpoint, sorted query params).
+# Agents often re-read the same connection or list within seconds while reasoning.
+# Disabled unless FIVETRAN_CACHE_TTL is set; any write clears it.
+_RESPONSE_CACHE: dict[tuple, tuple[float, dict[str, Any]]] = {}
+_RESPONSE_CACHE_MAXSIZE = 512
+
+# Last ETag and decoded body per GET (same key as _RESPONSE_CACHE). Sent back as
+# If-None-Match so an unchanged resource costs a body-less 304 instead of a full
+# download and parse. The API decides freshness, so writes needn't clear it.
+# Shares the FIVETRAN_CACHE_TTL opt-in, and skips cursor pages: those are the
+# largest bodies and each cursor is a new key that is rarely requested again.
+_ETAG_CACHE: dict[tuple, tuple[str, dict[str, Any]]] = {}
+_ETAG_CACHE_MAXSIZE = 64
+
+# Connector-type metadata is the same for every account and changes rarely, but most
+# sessions read it. These tools are served stale-while-revalidate: a fresh entry is
+# returned as is, a stale one is returned immediately while a background task
+# refetches it. Kept separate from _RESPONSE_CACHE so writes don't clear it.
+_SWR_TOOLS = frozenset({"metadata_connectors", "metadata_connector_config", "metadata_public_connectors"})
+_SWR_CACHE: dict[tuple, tuple[float, dict[str, Any]]] = {}
+_SWR_REFRESHING: dict[tuple, asyncio.Task] = {}
+
+# Rate-limit and gateway responses are retried with backoff. 429 means the request
+# was rejected outright, so it is safe to resend for any method; gateway errors
+# may hide a write that was applied, so those are only retried for GETs.
+_RETRY_ANY_METHOD = frozenset({429})
+_RETRY_GET_ONLY = frozenset({502, 503, 504})
+_MAX_ATTEMPTS = 5
+_MAX_RETRY_DELAY = 30.0
+
+# Merged with the client's default headers on requests that carry a body.
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Resolved once at import: FIVETRAN_ALLOW_WRITES cannot change for the life of the process.
+_ALLOWED_METHODS = (
+    frozenset({"GET", "POST", "PATCH", "PUT", "DELETE"}) if FIVETRAN_ALLOW_WRITES else frozenset({"GET"})
+)
+
+
 def check_write_permission(method: str) -> None:
     """Raise error if writes not allowed for non-GET methods."""
-    if method != "GET" and not FIVETRAN_ALLOW_WRITES:
+    if method not in _ALLOWED_METHODS:
         raise ValueError(
             f"Write operations ({method}) are disabled. "
             "Set FIVETRAN_ALLOW_WRITES=true to enable POST, PATCH, and DELETE requests."
         )
 
 
+@lru_cache(maxsize=1)
 def get_auth_header() -> dict[str, str]:
-    """Create Basic Auth header for Fivetran API."""
+    """Create Basic Auth header for Fivetran API.
+
+    Credentials are fixed for the life of the process, so the encoded header is
+    built once and the same dict is returned on every call. Callers must not mutate it.
+    """
     if not FIVETRAN_API_KEY or not FIVETRAN_API_SECRET:
         raise ValueError("FIVETRAN_API_KEY and FIVETRAN_API_SECRET must be set in environment")
     credentials = f"{FIVETRAN_API_KEY}:{FIVETRAN_API_SECRET}"
@@ -50,6 +122,24 @@ def get_auth_header() -> dict[str, str]:
     }
 
 
+def get_client() -> httpx.AsyncClient:
+    """Return the shared Fivetran API client, creating it on first use."""
+    global _CLIENT
+    if _CLIENT is None:
+        _CLIENT = httpx.AsyncClient(
+            base_url=BASE_URL,
+            http2=True,
+            headers=get_auth_header(),
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=20,
+                keepalive_expiry=30.0,
+            ),
+            timeout=httpx.Timeout(30.0, connect=10.0),
+        )
+    return _CLIENT
+
+
 async def fivetran_request(
     method: str,
     endpoint: str,
@@ -58,18 +148,103 @@ async def fivetran_request(
 ) -> dict[str, Any]:
     """Make a request to the Fivetran API."""
     check_write_permission(method)
-    url = f"{BASE_URL}{endpoint}"
-    async with httpx.AsyncClient() as client:
-        response = await client.request(
-            method=method,
-            url=url,
-            headers=get_auth_header(),
-            params=params,
-            json=json_body,
-            timeout=30.0,
-        )
-        response.raise_for_status()
-        return response.json()
+
+    cache_key = None
+    etag_entry = None
+    if method == "GET" and FIVETRAN_CACHE_TTL > 0:
+        cache_key = (endpoint, tuple(sorted((params or {}).items())))
+        cached = _RESPONSE_CACHE.get(cache_key)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+        if not (params and "cursor" in params):
+            etag_entry = _ETAG_CACHE.get(cache_key)
+
+    # Encode the body once with orjson rather than letting httpx re-run json.dumps per attempt.
+    content = orjson.dumps(json_body) if json_body is not None else None
+    if content is not None:
+        headers = _JSON_HEADERS
+    elif etag_entry is not None:
+        headers = {"If-None-Match": etag_entry[0]}
+    else:
+        headers = None
+
+    for attempt in range(_MAX_ATTEMPTS):
+        async with _INFLIGHT:
+            response = await get_client().request(
+                method=method,
+                url=endpoint,
+                params=params,
+                content=content,
+                headers=headers,
+            )
+        if attempt + 1 == _MAX_ATTEMPTS or not _should_retry(method, response.status_code):
+            break
+        # Sleep outside the semaphore so a backing-off call doesn't hold a slot.
+        await asyncio.sleep(_retry_delay(response, attempt))
+
+    if method != "GET":
+        # Writes can change anything a cached read returned (sync state, config, ...).
+        _RESPONSE_CACHE.clear()
+    if response.status_code == 304 and etag_entry is not None:
+        # Unchanged since we last saw it: reuse the decoded body, skip the download and parse.
+        result = etag_entry[1]
+    else:
+        # Only pay for raise_for_status (and its message formatting) on failure.
+        if not 200 <= response.status_code < 300:
+            response.raise_for_status()
+        result = orjson.loads(response.content)
+
+    cache_control = response.headers.get("cache-control", "")
+    if cache_key is None or "no-store" in cache_control:
+        return result
+    etag = response.headers.get("etag")
+    if etag and response.status_code != 304 and not (params and "cursor" in params):
+        if etag_entry is None and len(_ETAG_CACHE) >= _ETAG_CACHE_MAXSIZE:
+            del _ETAG_CACHE[next(iter(_ETAG_CACHE))]
+        _ETAG_CACHE[cache_key] = (etag, result)
+    if "no-cache" not in cache_control:
+        if cache_key not in _RESPONSE_CACHE and len(_RESPONSE_CACHE) >= _RESPONSE_CACHE_MAXSIZE:
+            # Evict the oldest entry; dicts keep insertion order.
+            del _RESPONSE_CACHE[next(iter(_RESPONSE_CACHE))]
+        _RESPONSE_CACHE[cache_key] = (time.monotonic() + FIVETRAN_CACHE_TTL, result)
+    return result
+
+
+async def fivetran_request_swr(endpoint: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
+    """GET through the stale-while-revalidate cache (see _SWR_TOOLS)."""
+    key = (endpoint, tuple(sorted((params or {}).items())))
+    cached = _SWR_CACHE.get(key)
+    if cached is None:
+        result = await fivetran_request("GET", endpoint, params=params)
+        _SWR_CACHE[key] = (time.monotonic() + FIVETRAN_METADATA_TTL, result)
+        return result
+    if cached[0] <= time.monotonic() and key not in _SWR_REFRESHING:
+        _SWR_REFRESHING[key] = asyncio.create_task(_swr_refresh(key, endpoint, params))
+    return cached[1]
+
+
+async def _swr_refresh(key: tuple, endpoint: str, params: dict[str, Any] | None) -> None:
+    # A failed refresh keeps serving the stale entry; the next call past expiry retries.
+    # Nothing awaits this task, so any failure (HTTP error, undecodable body, ...)
+    # must be swallowed here or asyncio reports it as never retrieved.
+    try:
+        result = await fivetran_request("GET", endpoint, params=params)
+        _SWR_CACHE[key] = (time.monotonic() + FIVETRAN_METADATA_TTL, result)
+    except Exception:
+        pass
+    finally:
+        del _SWR_REFRESHING[key]
+
+
+def _should_retry(method: str, status_code: int) -> bool:
+    return status_code in _RETRY_ANY_METHOD or (method == "GET" and status_code in _RETRY_GET_ONLY)
+
+
+def _retry_delay(response: httpx.Response, attempt: int) -> float:
+    """Seconds to wait before retrying: Retry-After if the API sent one, else exponential backoff."""
+    retry_after = response.headers.get("retry-after", "")
+    delay = float(retry_after) if retry_after.isdigit() else 2.0 ** attempt
+    return min(delay, _MAX_RETRY_DELAY) + random.uniform(0, 0.25)
 
 
 def validate_and_read_schema(schema_file: str) -> dict[str, Any]:
@@ -82,7 +257,7 @@ def validate_and_read_schema(schema_file: str) -> dict[str, Any]:
         schema_file: Path to the schema file (e.g., 'open-api-definitions/connections/list_connections.json')
 
     Returns:
-        The parsed schema content
+        The parsed schema content. The dict is shared between calls; do not mutate it.
 
     Raises:
         ValueError: If schema file is missing, invalid path, or invalid JSON
@@ -93,13 +268,24 @@ def validate_and_read_schema(schema_file: str) -> dict[str, Any]:
             "then provide its path to confirm you understand the response structure."
         )
 
-    # Validate path format
-    if not schema_file.startswith("open-api-definitions/"):
+    # Only the schema files of enabled tools are valid, which also rules out
+    # arbitrary paths outside open-api-definitions/.
+    if schema_file not in _SCHEMA_FILES:
         raise ValueError(
             f"Invalid schema_file path: '{schema_file}'. "
-            "Path must start with 'open-api-definitions/'"
+            "Path must be the schema_file of an available tool under 'open-api-definitions/'"
         )
 
+    return _load_schema(schema_file)
+
+
+@lru_cache(maxsize=None)
+def _load_schema(schema_file: str) -> dict[str, Any]:
+    """Read and parse a schema file once; the files don't change while the server runs.
+
+    Only successful loads are cached, so a missing or broken file is re-checked
+    on the next call.
+    """
     # Resolve and validate the file exists
     schema_path = SERVER_DIR / schema_file
 
@@ -111,14 +297,14 @@ def validate_and_read_schema(schema_file: str) -> dict[str, Any]:
 
     # Read and parse the schema
     try:
-        with open(schema_path) as f:
-            return json.load(f)
-    except json.JSONDecodeError as e:
+        return orjson.loads(schema_path.read_bytes())
+    except orjson.JSONDecodeError as e:
         raise ValueError(f"Invalid JSON in schema file '{schema_file}': {e}")
 
 
 # Tool definitions organized by resource
-# Each tool has: description, schema_file, method, endpoint, params (optional), auto_paginate (optional)
+# Each tool has: description, schema_file, method, endpoint, params (optional), query_params (optional)
+# Paginated endpoints are not walked server-side: the agent passes `cursor` back in as a query param.
 TOOLS = {
     # ============================================================================
     # ACCOUNT
@@ -1431,6 +1617,55 @@ PARAM_DEFINITIONS = {
     "id": {"type": "string", "description": "The unique identifier for the user within the account."},  # needs audit
 }
 
+class ToolSpec(NamedTuple):
+    """Call-time view of a TOOLS entry, with the per-call parsing done up front."""
+
+    method: str
+    schema_file: str
+    endpoint_segments: tuple[str, ...]
+    query_params: tuple[str, ...]
+
+
+# Endpoint templates are split into alternating literal and placeholder segments,
+# e.g. "/v1/groups/{group_id}/connections" becomes ("/v1/groups/", "group_id",
+# "/connections"), so building a URL per call is a plain join instead of a
+# str.format parse.
+_ENDPOINT_PARAM_RE = re.compile(r"\{(\w+)\}")
+
+
+def compile_tool(tool_config: dict) -> ToolSpec:
+    """Precompute everything execute_tool needs from one TOOLS entry."""
+    return ToolSpec(
+        method=tool_config["method"],
+        schema_file=tool_config["schema_file"],
+        endpoint_segments=tuple(_ENDPOINT_PARAM_RE.split(tool_config["endpoint"])),
+        query_params=tuple(tool_config.get("query_params", [])),
+    )
+
+
+# TOOLS stays a plain dict literal because split_openapi_by_endpoint.py edits it
+# in place; the request path reads these frozen specs instead.
+_TOOL_SPECS: MappingProxyType[str, ToolSpec] = MappingProxyType(
+    {name: compile_tool(config) for name, config in TOOLS.items()}
+)
+_SCHEMA_FILES = frozenset(spec.schema_file for spec in _TOOL_SPECS.values())
+
+
+def format_endpoint(segments: tuple[str, ...], arguments: dict[str, Any]) -> str:
+    """Fill the placeholder segments (odd indices) of a split endpoint template.
+
+    Placeholders are looked up straight in the tool arguments; the input schema
+    already requires every path param the template names.
+    """
+    if len(segments) == 1:
+        # No placeholders (e.g. /v1/connections): the template is the URL.
+        return segments[0]
+    parts = list(segments)
+    for i in range(1, len(parts), 2):
+        parts[i] = str(arguments[parts[i]])
+    return "".join(parts)
+
+
 def build_tool_schema(tool_name: str, tool_config: dict) -> Tool:
     """Build the MCP Tool definition (the input schema the agent sees) for one tool.
 
@@ -1451,10 +1686,11 @@ def build_tool_schema(tool_name: str, tool_config: dict) -> Tool:
     # Required params: path params (connection_id, schema_name, ...) and request_body.
     # All mandatory. The .get() fallback means a param missing from PARAM_DEFINITIONS
     # still gets a valid definition instead of becoming a required-but-undefined field.
+    # Definitions are shared between tools rather than copied; nothing mutates them.
     for param in tool_config.get("params", []):
         properties[param] = PARAM_DEFINITIONS.get(
             param, {"type": "string", "description": param}
-        ).copy()
+        )
         required.append(param)
 
     # Optional query params: added to properties so the agent MAY send them,
@@ -1462,7 +1698,7 @@ def build_tool_schema(tool_name: str, tool_config: dict) -> Tool:
     for param in tool_config.get("query_params", []):
         properties[param] = PARAM_DEFINITIONS.get(
             param, {"type": "string", "description": param}
-        ).copy()
+        )
 
     return Tool(
         name=tool_name,
@@ -1474,6 +1710,54 @@ def build_tool_schema(tool_name: str, tool_config: dict) -> Tool:
         },
     )
 
+
+# Synthetic tool that fans several read-only tool calls out at once, so an agent
+# fetching e.g. ten connection details pays one round-trip instead of ten.
+BULK_TOOL_NAME = "bulk_get"
+BULK_TOOL = Tool(
+    name=BULK_TOOL_NAME,
+    description=(
+        "Run several read-only (GET) tools concurrently and return all results in one response. "
+        "Each entry in `calls` names a tool and gives the arguments you would pass to it directly, "
+        "including its schema_file. Results come back in the same order, each with either a "
+        "`result` or an `error`."
+    ),
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "calls": {
+                "type": "array",
+                "description": "The tool calls to run.",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "name": {"type": "string", "description": "Name of a read-only (GET) tool"},
+                        "arguments": {"type": "object", "description": "Arguments for that tool, including schema_file"},
+                    },
+                    "required": ["name", "arguments"],
+                },
+                "minItems": 1,
+            },
+        },
+        "required": ["calls"],
+    },
+)
+
+# TOOLS and PARAM_DEFINITIONS are static, so every Tool is built once at import.
+# Kept as a tuple so nothing can append to or reorder the shared set.
+_TOOL_SCHEMAS: tuple[Tool, ...] = (
+    *(build_tool_schema(name, config) for name, config in TOOLS.items()),
+    BULK_TOOL,
+)
+
+# One compiled validator per tool. The SDK's built-in input check calls
+# jsonschema.validate, which re-checks the schema and picks a validator class on
+# every call; these are built once and call_tool runs them instead.
+_VALIDATORS: MappingProxyType[str, Any] = MappingProxyType({
+    tool.name: jsonschema.validators.validator_for(tool.inputSchema)(tool.inputSchema)
+    for tool in _TOOL_SCHEMAS
+})
+
 # Create the MCP server
 server = Server("fivetran")
 
@@ -1481,73 +1765,127 @@ server = Server("fivetran")
 @server.list_tools()
 async def list_tools() -> list[Tool]:
     """List available Fivetran tools."""
-    return [build_tool_schema(name, config) for name, config in TOOLS.items()]
+    return list(_TOOL_SCHEMAS)
+
+
+def validate_arguments(name: str, arguments: dict[str, Any]) -> None:
+    """Check arguments against the tool's inputSchema, as the SDK would.
+
+    Unknown tool names pass through; check_schema_acknowledged rejects them.
+    """
+    validator = _VALIDATORS.get(name)
+    if validator is None:
+        return
+    error = jsonschema.exceptions.best_match(validator.iter_errors(arguments))
+    if error is not None:
+        raise ValueError(f"Input validation error: {error.message}")
+
 
+def check_schema_acknowledged(name: str, arguments: dict[str, Any]) -> None:
+    """Enforce the read-then-confirm gate: the caller must echo the tool's schema_file."""
+    if name not in _TOOL_SPECS:
+        raise ValueError(f"Unknown tool: {name}")
 
-@server.call_tool()
+    expected_schema = _TOOL_SPECS[name].schema_file
+
+    # MANDATORY: Validate schema file before proceeding
+    provided_schema = arguments.get("schema_file", "")
+    if provided_schema != expected_schema:
+        raise ValueError(
+            f"Invalid schema_file. Expected '{expected_schema}'. "
+            f"You must read this file first, then provide the exact path."
+        )
+
+    validate_and_read_schema(provided_schema)
+
+
+def format_api_error(e: httpx.HTTPStatusError) -> str:
+    """Turn a failed Fivetran response into a short message for the agent."""
+    error_msg = f"Fivetran API error: {e.response.status_code}"
+    # Only try to decode bodies that claim to be JSON; gateway errors and
+    # rate-limit pages are often HTML or plain text.
+    error_detail = None
+    if "application/json" in e.response.headers.get("content-type", ""):
+        try:
+            error_detail = orjson.loads(e.response.content)
+        except orjson.JSONDecodeError:
+            pass
+    if isinstance(error_detail, dict):
+        error_msg += f" - {error_detail.get('message', str(error_detail))}"
+    elif error_detail is not None:
+        error_msg += f" - {error_detail}"
+    else:
+        error_msg += f" - {e.response.text}"
+    return error_msg
+
+
+@server.call_tool(validate_input=False)
 async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
     """Handle tool calls with mandatory schema validation and write confirmation."""
+    # Raised outside the try so the SDK reports it as an error result, as it does
+    # for its own input validation.
+    validate_arguments(name, arguments)
     try:
-        if name not in TOOLS:
-            raise ValueError(f"Unknown tool: {name}")
-
-        tool_config = TOOLS[name]
-        expected_schema = tool_config["schema_file"]
-
-        # MANDATORY: Validate schema file before proceeding
-        provided_schema = arguments.get("schema_file", "")
-        if provided_schema != expected_schema:
-            raise ValueError(
-                f"Invalid schema_file. Expected '{expected_schema}'. "
-                f"You must read this file first, then provide the exact path."
-            )
-
-        validate_and_read_schema(provided_schema)
-
-        # Execute the API call
-        result = await execute_tool(name, arguments)
-        return [TextContent(type="text", text=json.dumps(result, indent=2))]
+        if name == BULK_TOOL_NAME:
+            result = await execute_bulk(arguments["calls"])
+        else:
+            check_schema_acknowledged(name, arguments)
+            # Execute the API call
+            result = await execute_tool(name, arguments)
+        return [TextContent(type="text", text=orjson.dumps(result, option=orjson.OPT_INDENT_2).decode())]
 
     except httpx.HTTPStatusError as e:
-        error_msg = f"Fivetran API error: {e.response.status_code}"
-        try:
-            error_detail = e.response.json()
-            error_msg += f" - {error_detail.get('message', str(error_detail))}"
-        except Exception:
-            error_msg += f" - {e.response.text}"
-        return [TextContent(type="text", text=error_msg)]
+        return [TextContent(type="text", text=format_api_error(e))]
     except Exception as e:
         return [TextContent(type="text", text=f"Error: {str(e)}")]
 
 
+async def execute_bulk(calls: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Run several read-only tool calls concurrently for bulk_get.
+
+    Each call goes through the same schema_file gate as a direct call. Failures
+    are reported per call so one bad entry doesn't discard the other results.
+    """
+    async def run_one(call: dict[str, Any]) -> dict[str, Any]:
+        name = call.get("name", "")
+        arguments = call.get("arguments") or {}
+        try:
+            validate_arguments(name, arguments)
+            check_schema_acknowledged(name, arguments)
+            if _TOOL_SPECS[name].method != "GET":
+                raise ValueError(f"{BULK_TOOL_NAME} only runs read-only (GET) tools; '{name}' is not one.")
+            return {"name": name, "result": await execute_tool(name, arguments)}
+        except httpx.HTTPStatusError as e:
+            return {"name": name, "error": format_api_error(e)}
+        except Exception as e:
+            return {"name": name, "error": f"Error: {str(e)}"}
+
+    return await asyncio.gather(*(run_one(call) for call in calls))
+
+
 async def execute_tool(name: str, arguments: dict[str, Any]) -> dict[str, Any]:
     """Execute the API call after schema validation.
 
     Splits the incoming arguments into three kinds of input:
-      - path params : declared in tool_config["params"] (minus request_body);
+      - path params : declared in the tool's "params" (minus request_body);
                       fill the {connection_id}, {schema_name}, ... placeholders in the URL
-      - query params: declared in tool_config["query_params"]; sent as the URL
+      - query params: declared in the tool's "query_params"; sent as the URL
                       query string, but ONLY when the agent actually supplied them
       - request body: the "request_body" argument, a JSON string, for POST/PATCH calls
     """
-    tool_config = TOOLS[name]
-    method = tool_config["method"]
-    endpoint_template = tool_config["endpoint"]
+    spec = _TOOL_SPECS[name]
 
     # --- Path parameters -----------------------------------------------------
-    # Everything in "params" except request_body is a path param. Pull only the
-    # declared ones out of arguments, then substitute them into the endpoint URL.
-    path_param_names = [p for p in tool_config.get("params", []) if p != "request_body"]
-    path_params = {k: arguments[k] for k in path_param_names if k in arguments}
-    endpoint = endpoint_template.format(**path_params)
+    # Substitute the {connection_id}, {schema_name}, ... placeholders in the
+    # endpoint URL directly from arguments.
+    endpoint = format_endpoint(spec.endpoint_segments, arguments)
 
     # --- Query parameters ----------------------------------------------------
     # Optional. Include only the ones the agent provided (and that aren't None),
     # so omitted params never get appended to the query string.
-    query_param_names = tool_config.get("query_params", [])
     query_params = {
         k: arguments[k]
-        for k in query_param_names
+        for k in spec.query_params
         if k in arguments and arguments[k] is not None
     }
 
@@ -1556,14 +1894,16 @@ async def execute_tool(name: str, arguments: dict[str, Any]) -> dict[str, Any]:
     json_body = None
     if "request_body" in arguments:
         try:
-            json_body = json.loads(arguments["request_body"])
-        except json.JSONDecodeError as e:
+            json_body = orjson.loads(arguments["request_body"])
+        except orjson.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON in request_body: {e}")
 
     # --- Fire the request ----------------------------------------------------
     # Pass params only when non-empty so omitted query params leave the URL clean.
+    if name in _SWR_TOOLS:
+        return await fivetran_request_swr(endpoint, params=query_params or None)
     return await fivetran_request(
-        method,
+        spec.method,
         endpoint,
         params=query_params or None,
         json_body=json_body,
@@ -1577,13 +1917,23 @@ async def async_main():
             "FIVETRAN_API_KEY and FIVETRAN_API_SECRET environment variables must be set. "
             "Configure them in your .mcp.json or .env file."
         )
-    async with stdio_server() as (read_stream, write_stream):
-        await server.run(read_stream, write_stream, server.create_initialization_options())
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await server.run(read_stream, write_stream, server.create_initialization_options())
+    finally:
+        if _CLIENT is not None:
+            await _CLIENT.aclose()
 
 
 def main():
-    import asyncio
-    asyncio.run(async_main())
+    # uvloop has lower per-iteration overhead than the default selector loop.
+    # It isn't available on Windows, so fall back to plain asyncio there.
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(async_main())
+    else:
+        uvloop.run(async_main())
 
 
 if __name__ == "__main__":
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""Scripted workload for profiling the server's tool-call path.
+
+Calls call_tool() directly (no MCP client or stdio transport) against the real
+Fivetran API:
+  - walks every page of list_connections, following next_cursor
+  - fetches connection_details for the first connection N times
+
+Run it under a profiler that understands asyncio so time spent awaiting the
+network is separated from CPU time (TLS handshakes, JSON decode, event-loop
+overhead), e.g.:
+    scalene --cli tools/profile_server.py
+Run it with plain python to get wall-clock timings only.
+
+Only read-only tools are called. Requires FIVETRAN_API_KEY and
+FIVETRAN_API_SECRET in the environment.
+
+Usage:
+    python tools/profile_server.py [repetitions]
+"""
+
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import server  # noqa: E402
+
+
+async def call(name: str, arguments: dict) -> dict:
+    """Invoke a tool the way the MCP handler would and decode its JSON output."""
+    arguments = {"schema_file": server.TOOLS[name]["schema_file"], **arguments}
+    content = await server.call_tool(name, arguments)
+    text = content[0].text
+    if not text.startswith("{"):
+        raise RuntimeError(f"{name} failed: {text}")
+    return json.loads(text)
+
+
+async def workload(repetitions: int) -> None:
+    start = time.perf_counter()
+    connection_ids = []
+    cursor = None
+    pages = 0
+    while True:
+        args = {"limit": 100}
+        if cursor:
+            args["cursor"] = cursor
+        data = (await call("list_connections", args))["data"]
+        connection_ids.extend(item["id"] for item in data.get("items", []))
+        pages += 1
+        cursor = data.get("next_cursor")
+        if not cursor:
+            break
+    print(f"list_connections: {len(connection_ids)} connections in {pages} page(s), "
+          f"{time.perf_counter() - start:.2f}s")
+
+    if not connection_ids:
+        print("No connections found; skipping connection_details.")
+        return
+
+    start = time.perf_counter()
+    for _ in range(repetitions):
+        await call("connection_details", {"connection_id": connection_ids[0]})
+    elapsed = time.perf_counter() - start
+    print(f"connection_details x{repetitions}: {elapsed:.2f}s ({elapsed / repetitions * 1000:.1f}ms/call)")
+
+
+async def async_main(repetitions: int) -> None:
+    try:
+        await workload(repetitions)
+    finally:
+        if server._CLIENT is not None:
+            await server._CLIENT.aclose()
+
+
+def main():
+    repetitions = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    asyncio.run(async_main(repetitions))
+    return 0
+
+
+if __name__ == '__main__':
+    exit(main())